@@ -6,10 +6,14 @@ for data exchange, providing standardized transit information.
 
 The server exposes tools for:
 - Searching for public transport stops by name
+- Searching for stops while prefetching the trips of the top matches
 - Retrieving stop trips and schedules by stop ID
 """
 
+from contextlib import asynccontextmanager
+from typing import Annotated
 from fastmcp import FastMCP
+from pydantic import Field
 from dotenv import load_dotenv
 from at_service import ATService
 from gtfs_types import StopResponse
@@ -19,11 +23,26 @@ load_dotenv()
 
 at_service = ATService()
 
-mcp = FastMCP(name="auckland-transport")
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Warm the stops catalogue on startup and release the HTTP client on shutdown.
+    
+    The catalogue is loaded in the background so the server starts accepting
+    requests immediately, while the first search usually finds it cached.
+    """
+    at_service.start_warm_up()
+    try:
+        yield
+    finally:
+        await at_service.aclose()
+
+
+mcp = FastMCP(name="auckland-transport", lifespan=lifespan)
 
 
 @mcp.tool
-def search_stop(name: str) -> StopResponse:
+async def search_stop(name: str) -> StopResponse:
     """Search for Auckland Transport stops by name (case-insensitive substring match).
     
     Args:
@@ -33,11 +52,30 @@ def search_stop(name: str) -> StopResponse:
         StopResponse: A response containing a list of matching stops with attributes including
         stop_id, stop_code, stop_name, stop_lat, stop_lon, location_type, and wheelchair_boarding
     """
-    return at_service.search_stop(name)
+    return await at_service.search_stop(name)
+
+
+@mcp.tool
+async def search_and_prefetch(name: str, k: Annotated[int, Field(ge=0, le=10)] = 3) -> StopResponse:
+    """Search for Auckland Transport stops by name and prefetch trips for the top matches.
+    
+    Use this instead of search_stop when you expect to look up trips for one of the
+    matching stops next: trips for the first k matches are loaded in the background
+    so the follow-up get_stop_trips_by_stop_id call returns immediately.
+    
+    Args:
+        name: The stop name to search for
+        k: Number of top matching stops to prefetch trips for, from 0 to 10 (default: 3)
+        
+    Returns:
+        StopResponse: A response containing a list of matching stops with attributes including
+        stop_id, stop_code, stop_name, stop_lat, stop_lon, location_type, and wheelchair_boarding
+    """
+    return await at_service.search_and_prefetch(name, k)
 
 
 @mcp.tool
-def get_stop_trips_by_stop_id(stop_id: str) -> StopTripResponse:
+async def get_stop_trips_by_stop_id(stop_id: str) -> StopTripResponse:
     """Get the stop trips by stop id.
     Args:
         stop_id: The stop id to get the trips for
@@ -47,7 +85,7 @@ def get_stop_trips_by_stop_id(stop_id: str) -> StopTripResponse:
         arrival_time, departure_time, direction_id, drop_off_type, pickup_type, route_id, service_date, 
         shape_id, stop_headsign, stop_id, stop_sequence, and trip_headsign
     """
-    return at_service.get_stop_trips_by_stop_id(stop_id)
+    return await at_service.get_stop_trips_by_stop_id(stop_id)
 
 
 if __name__ == "__main__":
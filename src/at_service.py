@@ -2,17 +2,263 @@
 
 This module provides a service class for interacting with the Auckland Transport
 API. It handles authentication, request formatting, and response parsing for
-GTFS-based transit data.
+GTFS-based transit data. Requests are made asynchronously so that several tool
+calls can wait on the API at the same time. The day's stops catalogue is also
+persisted to disk so a restarted server can answer searches without refetching
+it.
 """
 
 import os
-import requests
+import time
+import logging
+import tempfile
+import asyncio
+import httpx
+from array import array
+from bisect import bisect_right
+from contextlib import suppress
 from datetime import datetime
+from itertools import compress
+from itertools import repeat
+from pathlib import Path
+from pydantic_core import from_json
+from pydantic_core import to_json
 
+from gtfs_types import Stop
+from gtfs_types import StopAttributes
 from gtfs_types import StopResponse
 from gtfs_types import StopTripResponse
 
 
+logger = logging.getLogger(__name__)
+
+# Failures of an API call that are answered from the cache when possible:
+# network errors and error statuses, and bodies that fail to decode or validate.
+_UPSTREAM_ERRORS = (httpx.HTTPError, ValueError, KeyError)
+
+# (minute since the epoch, date string, hour string) of the last _now_parts() call
+_now_parts_cache: tuple[int, str, str] = (-1, "", "")
+
+
+def _now_parts() -> tuple[str, str]:
+    """Get the current date and hour, formatting them at most once a minute.
+    
+    The cache is bucketed on wall-clock minutes, so the hour rolls over as
+    soon as the clock does.
+    
+    Returns:
+        tuple: Current date as YYYY-MM-DD and current hour as HH (00-23)
+    """
+    global _now_parts_cache
+    minute = int(time.time()) // 60
+    if _now_parts_cache[0] != minute:
+        now = datetime.now()
+        _now_parts_cache = (minute, now.strftime("%Y-%m-%d"), now.strftime("%H"))
+    return _now_parts_cache[1], _now_parts_cache[2]
+
+
+def _decode_stops(content: bytes) -> list[dict]:
+    """Decode a stops API response body into compacted raw stops.
+    
+    Only the shape the index relies on is checked here; the remaining
+    fields are validated when a stop is first turned into a Stop model.
+    
+    Args:
+        content: Raw JSON body of a stops API response
+        
+    Returns:
+        list: The compacted raw stops, in catalogue order
+        
+    Raises:
+        ValueError: If the body is not JSON or not a stops response
+    """
+    response = from_json(content)
+    if not isinstance(response, dict) or not isinstance(response.get("data"), list):
+        raise ValueError("Stops response has no \"data\" list")
+    return [_compact_stop(stop) for stop in response["data"]]
+
+
+def _compact_stop(stop: dict) -> dict:
+    """Copy a raw stop keeping only the fields the Stop model reads.
+    
+    The catalogue is held in memory for hours, so attributes the models
+    would discard on validation are dropped up front.
+    
+    Args:
+        stop: Raw stop dictionary from the API
+        
+    Returns:
+        dict: The stop with only its type, id and modelled attributes
+        
+    Raises:
+        ValueError: If the stop is not an object with attributes and a string stop_name
+    """
+    attributes = stop.get("attributes") if isinstance(stop, dict) else None
+    if not isinstance(attributes, dict) or not isinstance(attributes.get("stop_name"), str):
+        raise ValueError(f"Malformed stop in stops response: {stop!r}")
+    return {
+        "type": stop["type"],
+        "id": stop["id"],
+        "attributes": {key: attributes[key] for key in StopAttributes.model_fields if key in attributes},
+    }
+
+
+def _build_stop_index(content: bytes, etag: str | None, last_modified: str | None) -> "_StopIndex":
+    """Decode a stops API response body and build its search index.
+    
+    Args:
+        content: Raw JSON body of a stops API response
+        etag: ETag header of the response
+        last_modified: Last-Modified header of the response
+        
+    Returns:
+        _StopIndex: Search index over the decoded stops
+    """
+    return _StopIndex(_decode_stops(content), etag=etag, last_modified=last_modified)
+
+
+def _fold(text: str) -> str:
+    """Normalise text for case-insensitive matching.
+    
+    Used for both stop names and search needles so they always compare in
+    the same form.
+    
+    Args:
+        text: Stop name or search term
+        
+    Returns:
+        str: The text stripped of surrounding whitespace and casefolded
+    """
+    return text.strip().casefold()
+
+
+class _StopIndex:
+    """Search index over a day's stops catalogue.
+    
+    Stop names are casefolded once when the index is built. Needles of three
+    or more characters are answered from a trigram index: the rarest trigram
+    of the needle gives a short candidate list which is then checked with a
+    plain substring test. Shorter needles fall back to scanning a single
+    NUL-separated UTF-8 buffer of all names with C-level bytes.find. Each stop is
+    validated into a Stop model the first time it matches a search and the
+    model is reused for the lifetime of the index.
+    
+    Attributes:
+        etag (str): ETag the API sent with the catalogue, if any
+        last_modified (str): Last-Modified header the API sent, if any
+        stops (list): Raw stop dictionaries from the API, in catalogue order
+        models (list): Validated Stop for each raw stop, or None until first matched
+        names (list): Casefolded stop names, parallel to stops
+        blob (bytes): The encoded names joined with NUL separators
+        offsets (list): Byte offset in blob where each name starts
+        trigrams (dict): Maps each trigram to the ascending positions of the
+            names containing it
+    """
+
+    def __init__(self, stops: list[dict], etag: str | None = None, last_modified: str | None = None):
+        """Build the index from raw stop dictionaries.
+        
+        Args:
+            stops: The "data" list of a stops API response
+            etag: ETag header of the response, used to revalidate the catalogue
+            last_modified: Last-Modified header of the response
+        """
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stops = stops
+        self.models: list[Stop | None] = [None] * len(stops)
+        self.names = [_fold(stop["attributes"]["stop_name"]) for stop in stops]
+        encoded = [name.encode() for name in self.names]
+        self.offsets = []
+        position = 0
+        for name in encoded:
+            self.offsets.append(position)
+            position += len(name) + 1
+        self.blob = b"\x00".join(encoded)
+        self.trigrams: dict[str, array] = {}
+        for index, name in enumerate(self.names):
+            for trigram in {name[i:i + 3] for i in range(len(name) - 2)}:
+                postings = self.trigrams.get(trigram)
+                if postings is None:
+                    postings = self.trigrams[trigram] = array("i")
+                postings.append(index)
+
+    def search(self, needle: str) -> list[Stop]:
+        """Find stops whose name contains the needle.
+        
+        Args:
+            needle: Casefolded text to look for
+            
+        Returns:
+            list: The matching stops, in catalogue order
+        """
+        if not self.stops or "\x00" in needle:
+            return []
+        if len(needle) >= 3:
+            return self._models_at(self._search_trigrams(needle))
+        return self._models_at(self._scan_blob(needle))
+
+    def _search_trigrams(self, needle: str) -> list[int]:
+        """Find matching positions using the trigram index.
+        
+        Args:
+            needle: Casefolded text of at least three characters
+            
+        Returns:
+            list: Ascending positions of the names containing the needle
+        """
+        candidates = None
+        for i in range(len(needle) - 2):
+            postings = self.trigrams.get(needle[i:i + 3])
+            if postings is None:
+                return []
+            if candidates is None or len(postings) < len(candidates):
+                candidates = postings
+        # Chained map/compress keeps the per-candidate check in C, with no
+        # Python bytecode run per name.
+        names = self.names
+        matches = map(str.__contains__, map(names.__getitem__, candidates), repeat(needle))
+        return list(compress(candidates, matches))
+
+    def _scan_blob(self, needle: str) -> list[int]:
+        """Find matching positions by scanning the joined name buffer.
+        
+        Args:
+            needle: Casefolded text to look for
+            
+        Returns:
+            list: Ascending positions of the names containing the needle
+        """
+        blob, offsets = self.blob, self.offsets
+        needle_bytes = needle.encode()
+        last = len(offsets) - 1
+        found = []
+        position = blob.find(needle_bytes)
+        while position != -1:
+            index = bisect_right(offsets, position) - 1
+            found.append(index)
+            if index == last:
+                break
+            # Resume at the next name so each stop is reported once
+            position = blob.find(needle_bytes, offsets[index + 1])
+        return found
+
+    def _models_at(self, indices: list[int]) -> list[Stop]:
+        """Get the Stop models at the given positions, validating any not seen yet.
+        
+        Args:
+            indices: Positions in the catalogue
+            
+        Returns:
+            list: Stop models in the same order as indices
+        """
+        models, stops = self.models, self.stops
+        for index in indices:
+            if models[index] is None:
+                models[index] = Stop.model_validate(stops[index])
+        return [models[index] for index in indices]
+
+
 class ATService:
     """Service class for interacting with the Auckland Transport API.
     
@@ -24,28 +270,112 @@ class ATService:
         base_url (str): Base URL for the Auckland Transport API
         api_key (str): API key for authentication
         headers (dict): HTTP headers including authentication
+        cache_dir (Path): Directory the stops catalogue is persisted to
+        STOPS_TTL_SECONDS (int): How long a day's stops catalogue is reused
+        STOP_TRIPS_TTL_SECONDS (int): How long a stop's trips are reused
+        MAX_STALE_SECONDS (int): How long an expired entry is kept to answer
+            requests while the API is failing
+        FAILURE_BACKOFF_SECONDS (int): How long stale data is served without
+            retrying the API after a failed refresh
+        MAX_PREFETCH_STOPS (int): Most stops search_and_prefetch fetches trips for
     """
 
-    URL_MAP = {
-        "search_stop": "/stops?filter[date]={journey_date}",
-        'stop_trips_by_stop_id': "/stops/{stop_id}/stoptrips?filter[date]={journey_date}&filter[start_hour]={journey_hour}"
-    }
+    STOPS_TTL_SECONDS = 60 * 60
+    STOP_TRIPS_TTL_SECONDS = 30
+    MAX_STALE_SECONDS = 60 * 60
+    FAILURE_BACKOFF_SECONDS = 30
+    MAX_PREFETCH_STOPS = 10
 
     def __init__(self):
         """Initialize the ATService with API credentials from environment variables.
         
         Reads AT_BASE_URL and AT_API_KEY from environment variables and sets up
-        HTTP headers for API requests.
+        HTTP headers for API requests. URL builders for each endpoint are bound
+        to the base URL here so no template parsing happens per request. Today's
+        stops catalogue is loaded from the at-mcp directory under AT_CACHE_DIR
+        (default ~/.cache, so ~/.cache/at-mcp) if an earlier run saved one.
         """
         self.base_url = os.getenv("AT_BASE_URL")  
         self.api_key = os.getenv("AT_API_KEY")
         self.headers = {
             "Content-Type": "application/json",
             "Cache-Control": "no-cache",
-            "Ocp-Apim-Subscription-Key": os.getenv("AT_API_KEY")
         }
+        # Leave the key out rather than sending a None header, so the server
+        # still starts without credentials and only the API calls fail.
+        if self.api_key is not None:
+            self.headers["Ocp-Apim-Subscription-Key"] = self.api_key
+        # Always a dedicated subdirectory, since old catalogues are deleted from
+        # it; an empty AT_CACHE_DIR counts as unset rather than the working dir.
+        self.cache_dir = Path(os.getenv("AT_CACHE_DIR") or Path.home() / ".cache") / "at-mcp"
+        base_url = self.base_url
+        self._url_builders = {
+            "search_stop": lambda journey_date:
+                f"{base_url}/stops?filter[date]={journey_date}",
+            "stop_trips_by_stop_id": lambda stop_id, journey_date, journey_hour:
+                f"{base_url}/stops/{stop_id}/stoptrips?filter[date]={journey_date}&filter[start_hour]={journey_hour}",
+        }
+        # Cache entries are (value, expires_at) with expires_at on the
+        # time.monotonic() clock.
+        self._stops_cache: dict[str, tuple[_StopIndex, float]] = {}
+        self._stop_trips_cache: dict[tuple[str, str, str], tuple[StopTripResponse, float]] = {}
+        # Concurrent searches on a cold cache share a single catalogue fetch.
+        self._stops_lock = asyncio.Lock()
+        # Cache key -> time.monotonic() before which a failed refresh is not
+        # retried and the stale entry is served straight away.
+        self._retry_after: dict = {}
+        # In-flight stop trips fetches, so a tool call arriving while a
+        # prefetch is running waits for it instead of sending a second request.
+        self._stop_trips_pending: dict[tuple[str, str, str], asyncio.Task] = {}
+        # Strong references to fire-and-forget prefetch and persistence tasks.
+        self._background_tasks: set[asyncio.Task] = set()
+        # One pooled client keeps connections to the API alive between calls,
+        # so only the first request pays for the TCP and TLS handshakes.
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=10,
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                retries=2,
+            ),
+        )
+        journey_date, _ = _now_parts()
+        self._load_stops(journey_date)
 
-    def _make_request(self, url: str, method: str = "GET", params: dict = None, data: dict = None) -> dict:
+    def start_warm_up(self) -> None:
+        """Start loading today's stops catalogue in the background.
+        
+        The task is cancelled by aclose() if it is still running.
+        """
+        self._run_in_background(self.warm_up())
+
+    async def warm_up(self) -> None:
+        """Load today's stops catalogue ahead of the first search.
+        
+        Errors are logged rather than raised; the catalogue is fetched again
+        on first use.
+        """
+        journey_date, _ = _now_parts()
+        try:
+            await self._get_all_stops(journey_date)
+        except Exception:
+            logger.warning("Warming the stops catalogue failed", exc_info=True)
+
+    async def aclose(self) -> None:
+        """Stop background work and close the underlying HTTP client.
+        
+        Warm-up, prefetch, persistence and in-flight stop trips tasks are
+        cancelled and awaited first, so none of them runs against a closed
+        client.
+        """
+        tasks = [*self._background_tasks, *self._stop_trips_pending.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._client.aclose()
+
+    async def _make_request(self, url: str, method: str = "GET", params: dict = None, data: dict = None,
+                            headers: dict = None) -> httpx.Response:
         """Make an HTTP request to the Auckland Transport API.
         
         Args:
@@ -53,42 +383,261 @@ class ATService:
             method: HTTP method (default: "GET")
             params: Optional query parameters
             data: Optional request body data
+            headers: Optional headers added to the default API headers
+            
+        Returns:
+            httpx.Response: The API response. Its raw JSON content is left for the
+            caller to decode with pydantic's native JSON parser
+        """
+        return await self._client.request(method, url, params=params, data=data, headers=headers)
+
+    @staticmethod
+    def _cache_get(cache: dict, key):
+        """Return a cached value if it has not expired yet.
+        
+        Args:
+            cache: Cache dictionary mapping keys to (value, expires_at)
+            key: Key to look up
             
         Returns:
-            dict: JSON response from the API
+            The cached value, or None if missing or expired
+        """
+        entry = cache.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    @classmethod
+    def _cache_get_stale(cls, cache: dict, key):
+        """Return a cached value even if it has expired, up to MAX_STALE_SECONDS ago.
+        
+        Args:
+            cache: Cache dictionary mapping keys to (value, expires_at)
+            key: Key to look up
+            
+        Returns:
+            The cached value, or None if missing or expired for too long
+        """
+        entry = cache.get(key)
+        if entry is None or entry[1] <= time.monotonic() - cls.MAX_STALE_SECONDS:
+            return None
+        return entry[0]
+
+    @classmethod
+    def _cache_put(cls, cache: dict, key, value, ttl: float) -> None:
+        """Store a value in a cache, dropping entries expired for over MAX_STALE_SECONDS.
+        
+        Args:
+            cache: Cache dictionary mapping keys to (value, expires_at)
+            key: Key to store the value under
+            value: Value to cache
+            ttl: Time to live in seconds
         """
-        response = requests.request(method, url, headers=self.headers, params=params, data=data)
-        return response.json()
+        now = time.monotonic()
+        cutoff = now - cls.MAX_STALE_SECONDS
+        for old_key in [k for k, (_, expires_at) in cache.items() if expires_at <= cutoff]:
+            del cache[old_key]
+        cache[key] = (value, now + ttl)
 
-    def _get_url(self, url: str, **kwargs) -> str:
-        """Construct a full API URL from a URL template key and parameters.
+    def _get_backed_off(self, cache: dict, key):
+        """Return the stale entry for a key whose last refresh failed recently.
         
         Args:
-            url: Key from URL_MAP dictionary
-            **kwargs: Parameters to format into the URL template
+            cache: Cache dictionary mapping keys to (value, expires_at)
+            key: Key to look up
             
         Returns:
-            str: Complete API URL with base URL and formatted path
+            The stale cached value while within FAILURE_BACKOFF_SECONDS of a
+            failed refresh, otherwise None
+        """
+        if self._retry_after.get(key, 0) <= time.monotonic():
+            return None
+        return self._cache_get_stale(cache, key)
+
+    def _back_off(self, key) -> None:
+        """Record a failed refresh so callers get stale data without retrying for a while.
+        
+        Args:
+            key: Cache key whose refresh failed
         """
-        return f"{self.base_url}{self.URL_MAP[url].format(**kwargs)}"  
+        now = time.monotonic()
+        for old_key in [k for k, retry_at in self._retry_after.items() if retry_at <= now]:
+            del self._retry_after[old_key]
+        self._retry_after[key] = now + self.FAILURE_BACKOFF_SECONDS
 
-    def _get_date_time(self) -> str:
-        """Get the current date in YYYY-MM-DD format.
+    async def _get_all_stops(self, journey_date: str) -> tuple[_StopIndex, bool]:
+        """Get the full stops catalogue for a date, fetching it only when not cached.
         
+        Stops are kept as raw API dictionaries so searches can filter without
+        validating the whole catalogue. If the catalogue has expired and the
+        API cannot be reached, the expired catalogue is returned instead and
+        the API is not retried for FAILURE_BACKOFF_SECONDS.
+        
+        Args:
+            journey_date: Date in YYYY-MM-DD format
+            
         Returns:
-            str: Current date formatted as YYYY-MM-DD
+            tuple: Search index over every stop on the date, and whether it is
+            a stale copy served because the API failed
         """
-        return datetime.now().strftime("%Y-%m-%d")
+        stops = self._cache_get(self._stops_cache, journey_date)
+        if stops is not None:
+            return stops, False
+        stops = self._get_backed_off(self._stops_cache, journey_date)
+        if stops is not None:
+            return stops, True
+        async with self._stops_lock:
+            # Another caller may have filled the cache, or failed to, while we were waiting.
+            stops = self._cache_get(self._stops_cache, journey_date)
+            if stops is not None:
+                return stops, False
+            stops = self._get_backed_off(self._stops_cache, journey_date)
+            if stops is not None:
+                return stops, True
+            entry = self._stops_cache.get(journey_date)
+            previous = entry[0] if entry is not None else None
+            try:
+                stops = await self._fetch_stops(journey_date)
+            except _UPSTREAM_ERRORS:
+                stops = self._cache_get_stale(self._stops_cache, journey_date)
+                if stops is None:
+                    raise
+                self._back_off(journey_date)
+                return stops, True
+            self._retry_after.pop(journey_date, None)
+            self._cache_put(self._stops_cache, journey_date, stops, self.STOPS_TTL_SECONDS)
+        # Persist outside the lock so waiting searches are not held up by disk I/O.
+        # A 304 left the catalogue unchanged, so only its file's age is refreshed.
+        if stops is previous:
+            self._run_in_background(asyncio.to_thread(self._touch_stops, journey_date))
+        else:
+            self._run_in_background(asyncio.to_thread(self._save_stops, journey_date, stops))
+        return stops, False
 
-    def _get_hour(self) -> str:
-        """Get the current hour in HH format (24-hour).
+    def _run_in_background(self, coro) -> None:
+        """Run a coroutine as a task without waiting for it.
         
+        Args:
+            coro: The coroutine to run
+        """
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _stops_path(self, journey_date: str) -> Path:
+        """Get the path the stops catalogue for a date is persisted to.
+        
+        Args:
+            journey_date: Date in YYYY-MM-DD format
+            
         Returns:
-            str: Current hour formatted as HH (00-23)
+            Path: Location of the catalogue file for the date
+        """
+        return self.cache_dir / f"stops-{journey_date}.json"
+
+    def _load_stops(self, journey_date: str) -> None:
+        """Load a persisted stops catalogue for a date into the cache.
+        
+        The entry keeps the age of the file, so a catalogue saved more than
+        STOPS_TTL_SECONDS ago is loaded already expired and is revalidated
+        with a conditional request on first use. A missing file is ignored and
+        a file that cannot be read or indexed is deleted, since this runs at
+        server start-up and the on-disk copy is only an optimisation.
+        
+        Args:
+            journey_date: Date in YYYY-MM-DD format
         """
-        return datetime.now().strftime("%H")
+        path = self._stops_path(journey_date)
+        if not path.exists():
+            return
+        try:
+            age = time.time() - path.stat().st_mtime
+            saved = from_json(path.read_bytes())
+            stops = _StopIndex(saved["data"], etag=saved.get("etag"), last_modified=saved.get("last_modified"))
+        except Exception:
+            with suppress(OSError):
+                path.unlink(missing_ok=True)
+            return
+        self._stops_cache[journey_date] = (stops, time.monotonic() + self.STOPS_TTL_SECONDS - age)
 
-    def search_stop(self, name: str) -> StopResponse:
+    def _touch_stops(self, journey_date: str) -> None:
+        """Mark the persisted catalogue for a date as just revalidated.
+        
+        Failures are ignored; the on-disk copy is only an optimisation.
+        
+        Args:
+            journey_date: Date in YYYY-MM-DD format
+        """
+        try:
+            os.utime(self._stops_path(journey_date))
+        except OSError:
+            pass
+
+    def _save_stops(self, journey_date: str, stops: _StopIndex) -> None:
+        """Persist a stops catalogue to disk and remove catalogues of other dates.
+        
+        Failures are ignored; the on-disk copy is only an optimisation.
+        
+        Args:
+            journey_date: Date in YYYY-MM-DD format
+            stops: The catalogue to save
+        """
+        path = self._stops_path(journey_date)
+        temp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per writer, as several server processes may
+            # share the cache directory.
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=f"{path.name}.",
+                                             suffix=".tmp", delete=False) as temp_file:
+                temp_path = Path(temp_file.name)
+                temp_file.write(to_json({
+                    "etag": stops.etag,
+                    "last_modified": stops.last_modified,
+                    "data": stops.stops,
+                }))
+            temp_path.replace(path)
+            temp_path = None
+            for old_path in self.cache_dir.glob("stops-????-??-??.json"):
+                if old_path != path:
+                    old_path.unlink(missing_ok=True)
+        except OSError:
+            if temp_path is not None:
+                with suppress(OSError):
+                    temp_path.unlink(missing_ok=True)
+
+    async def _fetch_stops(self, journey_date: str) -> _StopIndex:
+        """Fetch the stops catalogue for a date from the API.
+        
+        If an expired catalogue for the date is still cached, the request is
+        made conditional on its ETag/Last-Modified and the cached index is
+        reused when the API answers 304 Not Modified.
+        
+        Args:
+            journey_date: Date in YYYY-MM-DD format
+            
+        Returns:
+            _StopIndex: Search index over every stop on the date
+        """
+        entry = self._stops_cache.get(journey_date)
+        previous = entry[0] if entry is not None else None
+        headers = {}
+        if previous is not None and previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous is not None and previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+        url = self._url_builders["search_stop"](journey_date=journey_date)
+        response = await self._make_request(url, "GET", headers=headers)
+        if response.status_code == 304 and previous is not None:
+            return previous
+        response.raise_for_status()
+        # Decoding and indexing thousands of stops is CPU-bound, so it runs in a
+        # worker thread to keep other tool calls responsive meanwhile.
+        return await asyncio.to_thread(_build_stop_index, response.content,
+                                       response.headers.get("ETag"),
+                                       response.headers.get("Last-Modified"))
+
+    async def search_stop(self, name: str) -> StopResponse:
         """Search for Auckland Transport stops by name.
         
         Performs a case-insensitive substring search on stop names. Returns
@@ -99,24 +648,17 @@ class ATService:
             
         Returns:
             StopResponse: Response containing a list of matching stops. Returns
-            empty list if name is None or empty string.
+            empty list if name is None, empty or only whitespace.
         """
-        if name is None or name == "":
+        needle = _fold(name) if name is not None else ""
+        if not needle:
             return StopResponse(data=[])
-        name = name.strip()
-        url = self._get_url("search_stop", journey_date=self._get_date_time())
-        stops = self._make_request(url, "GET")
-        stop_response = StopResponse.model_validate(stops)
-        
-        found_stops = StopResponse(data=[])
-        for stop in stop_response.data:
-            # Search for substring of stop name
-            if name.lower() in stop.attributes.stop_name.lower():
-                found_stops.data.append(stop)
-
-        return found_stops
+        journey_date, _ = _now_parts()
+        stops, stale = await self._get_all_stops(journey_date)
+        # The matches are already validated Stop models, so skip re-validation
+        return StopResponse.model_construct(data=stops.search(needle), stale=stale)
     
-    def get_stop_trips_by_stop_id(self, stop_id: str) -> StopTripResponse:
+    async def get_stop_trips_by_stop_id(self, stop_id: str) -> StopTripResponse:
         """Get stop trips for a specific stop ID.
         
         Retrieves all trips scheduled for a given stop on the current date
@@ -135,9 +677,82 @@ class ATService:
         if stop_id is None or stop_id == "":
             return StopTripResponse(data=[])
         stop_id = stop_id.strip()
-        url = self._get_url("stop_trips_by_stop_id", stop_id=stop_id, 
-                            journey_date=self._get_date_time(), 
-                            journey_hour=self._get_hour())
-        stop_trips = self._make_request(url, "GET")
-        stop_trip_response = StopTripResponse.model_validate(stop_trips)
+        journey_date, journey_hour = _now_parts()
+        cache_key = (stop_id, journey_date, journey_hour)
+        stop_trip_response = self._cache_get(self._stop_trips_cache, cache_key)
+        if stop_trip_response is not None:
+            return stop_trip_response
+        stop_trip_response = self._get_backed_off(self._stop_trips_cache, cache_key)
+        if stop_trip_response is not None:
+            return stop_trip_response.model_copy(update={"stale": True})
+        task = self._stop_trips_pending.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_stop_trips(cache_key))
+            self._stop_trips_pending[cache_key] = task
+            task.add_done_callback(lambda _: self._stop_trips_pending.pop(cache_key, None))
+        # Shielded so a cancelled caller does not cancel the fetch for other waiters
+        return await asyncio.shield(task)
+
+    async def _fetch_stop_trips(self, cache_key: tuple[str, str, str]) -> StopTripResponse:
+        """Fetch stop trips from the API and cache them.
+        
+        If the API cannot be reached, expired trips for the same stop and hour
+        are returned instead, marked as stale, and the API is not retried for
+        them for FAILURE_BACKOFF_SECONDS.
+        
+        Args:
+            cache_key: (stop_id, journey_date, journey_hour) to fetch trips for
+            
+        Returns:
+            StopTripResponse: The stop trips returned by the API
+        """
+        stop_id, journey_date, journey_hour = cache_key
+        url = self._url_builders["stop_trips_by_stop_id"](stop_id=stop_id,
+                                                          journey_date=journey_date,
+                                                          journey_hour=journey_hour)
+        try:
+            response = await self._make_request(url, "GET")
+            response.raise_for_status()
+            stop_trip_response = StopTripResponse.model_validate_json(response.content)
+        except _UPSTREAM_ERRORS:
+            stop_trip_response = self._cache_get_stale(self._stop_trips_cache, cache_key)
+            if stop_trip_response is None:
+                raise
+            self._back_off(cache_key)
+            return stop_trip_response.model_copy(update={"stale": True})
+        self._retry_after.pop(cache_key, None)
+        self._cache_put(self._stop_trips_cache, cache_key, stop_trip_response,
+                        self.STOP_TRIPS_TTL_SECONDS)
         return stop_trip_response
+
+    async def search_and_prefetch(self, name: str, k: int = 3) -> StopResponse:
+        """Search for stops by name and start fetching trips for the top matches.
+        
+        The search result is returned straight away. Stop trips for the first
+        k matches are fetched concurrently in the background, so a follow-up
+        get_stop_trips_by_stop_id call for one of them is served from the cache.
+        
+        Args:
+            name: The stop name to search for (case-insensitive substring match)
+            k: Number of matching stops to prefetch trips for, capped at
+                MAX_PREFETCH_STOPS so a prefetch cannot take over the connection pool
+            
+        Returns:
+            StopResponse: Response containing a list of matching stops
+        """
+        stop_response = await self.search_stop(name)
+        stop_ids = [stop.attributes.stop_id for stop in stop_response.data[:min(max(k, 0), self.MAX_PREFETCH_STOPS)]]
+        if stop_ids:
+            self._run_in_background(self._prefetch_stop_trips(stop_ids))
+        return stop_response
+
+    async def _prefetch_stop_trips(self, stop_ids: list[str]) -> None:
+        """Warm the stop trips cache for several stops at once.
+        
+        Errors are ignored; the trips are fetched again when actually requested.
+        
+        Args:
+            stop_ids: The stop ids to fetch trips for
+        """
+        await asyncio.gather(*(self.get_stop_trips_by_stop_id(stop_id) for stop_id in stop_ids),
+                             return_exceptions=True)
@@ -2,12 +2,97 @@
 
 This module defines the data models used to parse and validate responses from
 the Auckland Transport API, which follows the GTFS standard for transit data.
+The models are frozen because validated instances are cached and shared
+between responses.
 """
 
+from datetime import date
+from functools import lru_cache
 from pydantic import BaseModel
+from pydantic import BeforeValidator
+from pydantic import ConfigDict
+from pydantic import PlainSerializer
+from pydantic import WithJsonSchema
+from typing import Annotated
 from typing import List
 
 
+@lru_cache(maxsize=4096)
+def _parse_gtfs_time(value: str) -> int:
+    """Convert a GTFS HH:MM:SS time to seconds since midnight.
+    
+    GTFS times can pass 24:00:00 for trips running after midnight. Results
+    are cached so rows with the same time share one int object.
+    
+    Args:
+        value: Time in HH:MM:SS format
+        
+    Returns:
+        int: Seconds since midnight of the service date
+    """
+    hours, minutes, seconds = value.split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+
+
+def _format_gtfs_time(value: int) -> str:
+    """Convert seconds since midnight back to a GTFS HH:MM:SS time.
+    
+    Args:
+        value: Seconds since midnight of the service date
+        
+    Returns:
+        str: Time in HH:MM:SS format
+    """
+    return f"{value // 3600:02d}:{value // 60 % 60:02d}:{value % 60:02d}"
+
+
+@lru_cache(maxsize=64)
+def _parse_gtfs_date(value: str) -> int:
+    """Convert a YYYY-MM-DD date to its proleptic Gregorian ordinal.
+    
+    Results are cached so every row of a response shares one int object.
+    
+    Args:
+        value: Date in YYYY-MM-DD format
+        
+    Returns:
+        int: The date's ordinal, as returned by date.toordinal()
+    """
+    return date.fromisoformat(value).toordinal()
+
+
+def _format_gtfs_date(value: int) -> str:
+    """Convert a date ordinal back to YYYY-MM-DD.
+    
+    Args:
+        value: The date's ordinal
+        
+    Returns:
+        str: Date in YYYY-MM-DD format
+    """
+    return date.fromordinal(value).isoformat()
+
+
+# Stored as ints to keep stop trip rows small and comparable, but read from and
+# written to JSON as strings so the API and MCP output formats are unchanged.
+# GtfsTime holds seconds since midnight of the service date and GtfsDate holds
+# the date's ordinal. Model docstrings become MCP schema descriptions, so they
+# describe the string wire format and this comment is the only place the int
+# storage is documented.
+GtfsTime = Annotated[
+    int,
+    BeforeValidator(lambda value: _parse_gtfs_time(value) if isinstance(value, str) else value),
+    PlainSerializer(_format_gtfs_time, return_type=str),
+    WithJsonSchema({"type": "string", "description": "Time in HH:MM:SS format"}),
+]
+GtfsDate = Annotated[
+    int,
+    BeforeValidator(lambda value: _parse_gtfs_date(value) if isinstance(value, str) else value),
+    PlainSerializer(_format_gtfs_date, return_type=str),
+    WithJsonSchema({"type": "string", "description": "Date in YYYY-MM-DD format"}),
+]
+
+
 class StopAttributes(BaseModel):
     """Attributes of a transit stop in GTFS format.
     
@@ -20,6 +105,8 @@ class StopAttributes(BaseModel):
         stop_name: Name of the stop
         wheelchair_boarding: Wheelchair accessibility (0=unknown, 1=accessible, 2=not accessible)
     """
+    model_config = ConfigDict(frozen=True)
+
     location_type: int
     stop_code: str
     stop_id: str
@@ -36,6 +123,8 @@ class Stop(BaseModel):
         id: Unique identifier for the stop resource
         attributes: Stop attributes containing stop details
     """
+    model_config = ConfigDict(frozen=True)
+
     type: str
     id: str
     attributes: StopAttributes
@@ -46,8 +135,13 @@ class StopResponse(BaseModel):
     
     Attributes:
         data: List of Stop objects matching the search criteria
+        stale: True when the API could not be reached and the stops come from
+            an expired cached catalogue
     """
+    model_config = ConfigDict(frozen=True)
+
     data: List[Stop]
+    stale: bool = False
 
 
 class StopTripAttributes(BaseModel):
@@ -70,13 +164,15 @@ class StopTripAttributes(BaseModel):
         stop_sequence: Order of this stop in the trip sequence
         trip_headsign: Text displayed on the vehicle for this trip
     """
-    arrival_time: str
-    departure_time: str
+    model_config = ConfigDict(frozen=True)
+
+    arrival_time: GtfsTime
+    departure_time: GtfsTime
     direction_id: int
     drop_off_type: int
     pickup_type: int
     route_id: str
-    service_date: str
+    service_date: GtfsDate
     shape_id: str
     stop_headsign: str
     stop_id: str
@@ -92,6 +188,8 @@ class StopTrip(BaseModel):
         id: Unique identifier for the stop trip resource
         attributes: Stop trip attributes containing trip details
     """
+    model_config = ConfigDict(frozen=True)
+
     type: str
     id: str
     attributes: StopTripAttributes
@@ -102,5 +200,10 @@ class StopTripResponse(BaseModel):
     
     Attributes:
         data: List of StopTrip objects for the specified stop
+        stale: True when the API could not be reached and the trips come from
+            an expired cached response
     """
-    data: List[StopTrip]
\ No newline at end of file
+    model_config = ConfigDict(frozen=True)
+
+    data: List[StopTrip]
+    stale: bool = False
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""Shared fixtures for the Auckland Transport service tests.
+
+The API is replaced with an httpx.MockTransport so the tests run offline and
+can count the requests the service makes.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from at_service import ATService
+from at_service import _now_parts
+
+
+STOP_NAMES = [
+    "Britomart Train Station",
+    "Newmarket Train Station",
+    "Queen Street / Wellesley Street",
+    "Albert Street / Victoria Street West",
+    "Karangahape Road",
+    "Ponsonby Road / Franklin Road",
+    "Mt Eden Road / Stokes Road",
+    "Dominion Road / Balmoral Road",
+    "Straße Test Stop",
+    "Ōtāhuhu Bus Station",
+    "Onehunga Wharf",
+    "Half Moon Bay Ferry Terminal",
+    "A",
+    "",
+]
+
+
+def make_stop(index: int, name: str) -> dict:
+    """Build a raw stop as returned by the stops endpoint."""
+    return {
+        "type": "stop",
+        "id": f"{index}-ab12c",
+        "attributes": {
+            "location_type": 0,
+            "stop_code": str(index),
+            "stop_id": f"{index}-ab12c",
+            "stop_lat": -36.8,
+            "stop_lon": 174.7,
+            "stop_name": name,
+            "wheelchair_boarding": 1,
+            "zone_id": "merged_1",
+        },
+    }
+
+
+def make_stop_trip(stop_id: str) -> dict:
+    """Build a raw stop trip as returned by the stop trips endpoint."""
+    journey_date, _ = _now_parts()
+    return {
+        "type": "stoptrip",
+        "id": f"{stop_id}-trip",
+        "attributes": {
+            "arrival_time": "24:05:00",
+            "departure_time": "24:06:00",
+            "direction_id": 0,
+            "drop_off_type": 0,
+            "pickup_type": 0,
+            "route_id": "NX1-203",
+            "service_date": journey_date,
+            "shape_id": "shape-1",
+            "stop_headsign": "Britomart",
+            "stop_id": stop_id,
+            "stop_sequence": 3,
+            "trip_headsign": "Britomart",
+        },
+    }
+
+
+class FakeAPI:
+    """Stand-in for the Auckland Transport API that records every request.
+    
+    Attributes:
+        stops (list): Raw stops served by the stops endpoint
+        etag (str): ETag sent with the stops catalogue
+        stops_content (bytes): Body served by the stops endpoint instead of
+            stops, when set
+        fail (bool): Answer every request with a 503 when set
+        requests (list): Every request received, in order
+    """
+
+    def __init__(self):
+        self.stops = [make_stop(index, name) for index, name in enumerate(STOP_NAMES)]
+        self.etag = '"v1"'
+        self.stops_content: bytes | None = None
+        self.fail = False
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail:
+            return httpx.Response(503)
+        path = request.url.path
+        if path == "/stops":
+            if request.headers.get("If-None-Match") == self.etag:
+                return httpx.Response(304)
+            content = self.stops_content
+            if content is None:
+                content = json.dumps({"data": self.stops}).encode()
+            return httpx.Response(200, headers={"ETag": self.etag}, content=content)
+        if path.startswith("/stops/") and path.endswith("/stoptrips"):
+            stop_id = path.split("/")[2]
+            return httpx.Response(200, content=json.dumps({"data": [make_stop_trip(stop_id)]}).encode())
+        return httpx.Response(404)
+
+    def count(self, path_prefix: str) -> int:
+        """Number of requests received whose path starts with path_prefix."""
+        return sum(request.url.path.startswith(path_prefix) for request in self.requests)
+
+
+@pytest.fixture(autouse=True)
+def environment(monkeypatch, tmp_path):
+    """Point the service at the fake API and a per-test cache directory."""
+    monkeypatch.setenv("AT_BASE_URL", "https://api.test")
+    monkeypatch.setenv("AT_API_KEY", "test-key")
+    monkeypatch.setenv("AT_CACHE_DIR", str(tmp_path))
+
+
+@pytest.fixture
+def api():
+    return FakeAPI()
+
+
+@pytest.fixture
+def make_service(api):
+    """Create ATService instances whose HTTP client talks to the fake API.
+    
+    The caller closes the service with aclose().
+    """
+    async def factory() -> ATService:
+        service = ATService()
+        await service._client.aclose()
+        service._client = httpx.AsyncClient(headers=service.headers, transport=httpx.MockTransport(api))
+        return service
+    return factory
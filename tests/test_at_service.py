@@ -0,0 +1,308 @@
+"""Tests for ATService search, caching, revalidation and persistence."""
+
+import asyncio
+import os
+import time
+
+import httpx
+import pytest
+
+from at_service import _now_parts
+from conftest import STOP_NAMES
+
+
+def expire(cache: dict, key) -> None:
+    """Make a cache entry expired without discarding it."""
+    value, _ = cache[key]
+    cache[key] = (value, time.monotonic() - 1)
+
+
+async def drain(service) -> None:
+    """Wait for the service's background tasks, such as persistence, to finish."""
+    while service._background_tasks:
+        await asyncio.gather(*service._background_tasks)
+
+
+def brute_force(needle: str) -> list[str]:
+    """Stop ids whose name contains the needle, found by a linear scan."""
+    needle = needle.strip().casefold()
+    return [f"{index}-ab12c" for index, name in enumerate(STOP_NAMES) if needle in name.casefold()]
+
+
+def needles() -> list[str]:
+    """Every substring of up to five characters of the stop names, plus misses."""
+    found = {"zzz", "ss", "STRASSE", "  queen  ", "ōtā", "road /", "a\x00b", "/ ", "é"}
+    for name in STOP_NAMES:
+        for length in range(1, 6):
+            for start in range(len(name) - length + 1):
+                found.add(name[start:start + length])
+    return sorted(found)
+
+
+def test_search_matches_brute_force_scan(make_service):
+    async def run():
+        service = await make_service()
+        try:
+            for needle in needles():
+                if not needle.strip():
+                    continue
+                response = await service.search_stop(needle)
+                assert [stop.id for stop in response.data] == brute_force(needle), needle
+                assert response.stale is False
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+def test_search_ignores_blank_names(make_service, api):
+    async def run():
+        service = await make_service()
+        try:
+            for name in (None, "", "   "):
+                assert (await service.search_stop(name)).data == []
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+    assert api.requests == []
+
+
+def test_expired_catalogue_is_revalidated_with_etag(make_service, api):
+    async def run():
+        service = await make_service()
+        journey_date, _ = _now_parts()
+        try:
+            await service.search_stop("road")
+            cached = service._stops_cache[journey_date][0]
+            expire(service._stops_cache, journey_date)
+            response = await service.search_stop("road")
+            assert [stop.id for stop in response.data] == brute_force("road")
+            # A 304 keeps the existing index and renews its expiry.
+            assert service._stops_cache[journey_date][0] is cached
+            assert service._cache_get(service._stops_cache, journey_date) is cached
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+    assert api.count("/stops") == 2
+    assert "If-None-Match" not in api.requests[0].headers
+    assert api.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_changed_catalogue_replaces_index(make_service, api):
+    async def run():
+        service = await make_service()
+        journey_date, _ = _now_parts()
+        try:
+            await service.search_stop("road")
+            expire(service._stops_cache, journey_date)
+            api.etag = '"v2"'
+            api.stops = api.stops[:1]
+            response = await service.search_stop("train")
+            assert [stop.id for stop in response.data] == ["0-ab12c"]
+            assert service._stops_cache[journey_date][0].etag == '"v2"'
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+def test_stale_catalogue_served_with_backoff(make_service, api):
+    async def run():
+        service = await make_service()
+        journey_date, _ = _now_parts()
+        try:
+            await service.search_stop("road")
+            expire(service._stops_cache, journey_date)
+            api.fail = True
+            for _ in range(3):
+                response = await service.search_stop("road")
+                assert [stop.id for stop in response.data] == brute_force("road")
+                assert response.stale is True
+            # Only the first stale search tried the API; the rest were backed off.
+            assert api.count("/stops") == 2
+
+            service._retry_after.clear()
+            api.fail = False
+            response = await service.search_stop("road")
+            assert response.stale is False
+            assert api.count("/stops") == 3
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+def test_cold_catalogue_failure_raises(make_service, api):
+    async def run():
+        service = await make_service()
+        try:
+            api.fail = True
+            with pytest.raises(httpx.HTTPStatusError):
+                await service.search_stop("road")
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("content", [
+    b"not json",
+    b'{"data": null}',
+    b"[]",
+    b'{"data": [1]}',
+    b'{"data": [{"type": "stop", "id": "1", "attributes": null}]}',
+])
+def test_malformed_catalogue_falls_back_to_stale(make_service, api, content):
+    async def run():
+        service = await make_service()
+        journey_date, _ = _now_parts()
+        try:
+            await service.search_stop("road")
+            expire(service._stops_cache, journey_date)
+            api.etag = '"v2"'
+            api.stops_content = content
+            response = await service.search_stop("road")
+            assert [stop.id for stop in response.data] == brute_force("road")
+            assert response.stale is True
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+def test_stale_stop_trips_served_with_backoff(make_service, api):
+    async def run():
+        service = await make_service()
+        journey_date, journey_hour = _now_parts()
+        cache_key = ("0-ab12c", journey_date, journey_hour)
+        try:
+            response = await service.get_stop_trips_by_stop_id("0-ab12c")
+            assert response.stale is False
+            assert response.model_dump()["data"][0]["attributes"]["arrival_time"] == "24:05:00"
+            expire(service._stop_trips_cache, cache_key)
+            api.fail = True
+            for _ in range(3):
+                response = await service.get_stop_trips_by_stop_id("0-ab12c")
+                assert response.stale is True
+                assert response.data[0].attributes.stop_id == "0-ab12c"
+            assert api.count("/stops/0-ab12c/stoptrips") == 2
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+
+
+def test_concurrent_stop_trips_share_one_request(make_service, api):
+    async def run():
+        service = await make_service()
+        try:
+            responses = await asyncio.gather(*(service.get_stop_trips_by_stop_id("0-ab12c") for _ in range(5)))
+            assert len({id(response) for response in responses}) == 1
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+    assert api.count("/stops/0-ab12c/stoptrips") == 1
+
+
+def test_catalogue_is_saved_and_loaded(make_service, api, tmp_path):
+    async def run():
+        service = await make_service()
+        try:
+            await service.search_stop("road")
+            await drain(service)
+        finally:
+            await service.aclose()
+
+        restarted = await make_service()
+        try:
+            response = await restarted.search_stop("road")
+            assert [stop.id for stop in response.data] == brute_force("road")
+            journey_date, _ = _now_parts()
+            assert restarted._stops_cache[journey_date][0].etag == '"v1"'
+        finally:
+            await restarted.aclose()
+
+    asyncio.run(run())
+    journey_date, _ = _now_parts()
+    assert (tmp_path / "at-mcp" / f"stops-{journey_date}.json").exists()
+    # The restarted service answered from disk without asking the API.
+    assert api.count("/stops") == 1
+
+
+def test_expired_saved_catalogue_is_revalidated(make_service, api, tmp_path):
+    async def run():
+        service = await make_service()
+        try:
+            await service.search_stop("road")
+            await drain(service)
+        finally:
+            await service.aclose()
+
+        journey_date, _ = _now_parts()
+        path = tmp_path / "at-mcp" / f"stops-{journey_date}.json"
+        saved_at = time.time() - service.STOPS_TTL_SECONDS - 60
+        path.touch()
+        os.utime(path, (saved_at, saved_at))
+
+        restarted = await make_service()
+        try:
+            await restarted.search_stop("road")
+            await drain(restarted)
+        finally:
+            await restarted.aclose()
+        # The 304 refreshed the file's age rather than rewriting it.
+        assert path.stat().st_mtime > saved_at + 60
+
+    asyncio.run(run())
+    assert api.count("/stops") == 2
+    assert api.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.parametrize("content", [b"not json", b"{}", b'{"data": [1]}'])
+def test_corrupt_catalogue_is_deleted(make_service, api, tmp_path, content):
+    journey_date, _ = _now_parts()
+    cache_dir = tmp_path / "at-mcp"
+    cache_dir.mkdir()
+    path = cache_dir / f"stops-{journey_date}.json"
+    path.write_bytes(content)
+
+    async def run():
+        service = await make_service()
+        try:
+            assert service._stops_cache == {}
+            response = await service.search_stop("road")
+            assert [stop.id for stop in response.data] == brute_force("road")
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+    assert not path.exists() or path.read_bytes() != content
+    assert api.count("/stops") == 1
+
+
+def test_save_removes_only_older_catalogues(make_service, tmp_path):
+    cache_dir = tmp_path / "at-mcp"
+    cache_dir.mkdir()
+    old_path = cache_dir / "stops-2000-01-01.json"
+    old_path.write_bytes(b"{}")
+    other_path = cache_dir / "stops-notes.json"
+    other_path.write_bytes(b"keep")
+    (tmp_path / "stops-2000-01-02.json").write_bytes(b"keep")
+
+    async def run():
+        service = await make_service()
+        try:
+            await service.search_stop("road")
+            await drain(service)
+        finally:
+            await service.aclose()
+
+    asyncio.run(run())
+    journey_date, _ = _now_parts()
+    assert not old_path.exists()
+    assert other_path.exists()
+    assert (tmp_path / "stops-2000-01-02.json").exists()
+    assert sorted(path.name for path in cache_dir.iterdir()) == sorted(["stops-notes.json", f"stops-{journey_date}.json"])